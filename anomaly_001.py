@@ -35,10 +35,15 @@ Full, runnable version with minor robustness fixes:
 import os
 import sys
 import random
+import functools
+import itertools
+import time
 import json
-import urllib.request
-from urllib.parse import quote_plus
+import http.client
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+from urllib.parse import quote_plus, urlsplit, urljoin
 import getpass
+import threading
 import webbrowser
 import tkinter as tk
 import tkinter.font as tkfont
@@ -47,11 +52,55 @@ from tkinter import scrolledtext, simpledialog, messagebox
 
 
 # requires Pillow: pip install pillow
-from PIL import Image, ImageTk, ImageFilter
+import PIL
+from PIL import Image, ImageTk, ImageFilter, ImageDraw, ImageColor, ImageFont
+# requires NumPy: pip install numpy
+import numpy as np
 
 # -------------------------
 # Fullscreen image glitch effect
 # -------------------------
+# (image_path, screen_w, screen_h) -> (resized PIL image, its NumPy array, PhotoImage)
+# ("flash", image_path, w, h) -> (resized PIL image, None, PhotoImage) for the photo flash
+_GLITCH_IMG_CACHE = {}
+
+
+def _pooled_fullscreen(root, name, frameless=True):
+    """
+    Return the hidden fullscreen Toplevel kept on `root` as attribute `name`,
+    creating it on first use. Glitches deiconify()/withdraw() the same window
+    instead of building and destroying a native window every time.
+    """
+    win = getattr(root, name, None)
+    if win is not None and win.winfo_exists():
+        return win
+    win = tk.Toplevel(root)
+    win.withdraw()
+    try:
+        win.attributes("-fullscreen", True)
+    except Exception:
+        sw, sh = screen_size(root)
+        win.geometry(f"{sw}x{sh}+0+0")
+    try:
+        win.attributes("-topmost", True)
+    except Exception:
+        pass
+    if frameless:
+        win.overrideredirect(True)  # remove window frame
+    win.show_token = 0
+    setattr(root, name, win)
+    return win
+
+
+def _hide_pooled(win, token):
+    """Withdraw a pooled window, unless it has been re-shown since `token` was issued."""
+    try:
+        if win.winfo_exists() and win.show_token == token:
+            win.withdraw()
+    except Exception:
+        pass
+
+
 def show_image_glitch(root, image_path, duration_ms=750, noise_pixels=800, flicker_times=3):
     """
     Show a fullscreen, topmost Toplevel that displays `image_path` for duration_ms.
@@ -63,51 +112,64 @@ def show_image_glitch(root, image_path, duration_ms=750, noise_pixels=800, flick
     - Call it from static_overlay() (see integration example below).
     """
     try:
-        # Create fullscreen overlay window (no decorations)
-        win = tk.Toplevel(root)
-        try:
-            win.attributes("-fullscreen", True)
-        except Exception:
-            sw, sh = win.winfo_screenwidth(), win.winfo_screenheight()
-            win.geometry(f"{sw}x{sh}+0+0")
-        try:
-            win.attributes("-topmost", True)
-        except Exception:
-            pass
-        win.overrideredirect(True)  # remove window frame
-
-        sw, sh = win.winfo_screenwidth(), win.winfo_screenheight()
-
-        # Load image with Pillow so we can resize and sample pixels
-        try:
-            img = Image.open(image_path).convert("RGBA")
-        except Exception as e:
-            # fallback: show a plain color box if image can't be loaded
-            canvas = tk.Canvas(win, width=sw, height=sh, highlightthickness=0, bg="black")
+        # Reuse the fullscreen overlay window (no decorations); a new token makes
+        # any hide still pending from the previous glitch a no-op
+        win = _pooled_fullscreen(root, "_glitch_toplevel")
+        win.show_token += 1
+        token = win.show_token
+        hide = lambda: _hide_pooled(win, token)
+
+        sw, sh = screen_size(root)
+
+        # Place image on a Canvas so we can overlay disorder rectangles; the canvas
+        # lives as long as the pooled window and is cleared for every glitch
+        canvas = getattr(win, "canvas", None)
+        if canvas is None:
+            canvas = tk.Canvas(win, width=sw, height=sh, highlightthickness=0)
             canvas.pack(fill="both", expand=True)
-            win.after(duration_ms, lambda: (win.destroy() if win.winfo_exists() else None))
-            return
-
-        # Resize image to cover screen while preserving aspect ratio
-        img_ratio = img.width / img.height
-        screen_ratio = sw / sh
-        if img_ratio > screen_ratio:
-            # image is wider: scale by height
-            new_h = sh
-            new_w = int(img_ratio * new_h)
-        else:
-            new_w = sw
-            new_h = int(new_w / img_ratio)
-        img = img.resize((new_w, new_h), Image.LANCZOS)
-
-        # Slight blur/sharpen to make the glitch pop
-        img = img.filter(ImageFilter.UnsharpMask(radius=1, percent=50, threshold=2))
-
-        photo = ImageTk.PhotoImage(img)
+            win.canvas = canvas
+        canvas.delete("all")
+        canvas.configure(bg="black")
+
+        # The resized image never changes for a given screen, so decode/resize/sharpen
+        # once and reuse the PIL image, its pixel array and the PhotoImage afterwards.
+        key = (image_path, sw, sh)
+        cached = _GLITCH_IMG_CACHE.get(key)
+        if cached is None:
+            # Load image with Pillow so we can resize and sample pixels
+            try:
+                img = Image.open(image_path)
+                # let the JPEG decoder shrink towards screen size via DCT scaling
+                img.draft("RGB", (sw, sh))
+                img = img.convert("RGBA")
+            except Exception as e:
+                # fallback: show a plain color box if image can't be loaded
+                win.deiconify()
+                win.after(duration_ms, hide)
+                return
 
-        # Place image on a Canvas so we can overlay disorder rectangles
-        canvas = tk.Canvas(win, width=sw, height=sh, highlightthickness=0)
-        canvas.pack(fill="both", expand=True)
+            # Resize image to cover screen while preserving aspect ratio
+            img_ratio = img.width / img.height
+            screen_ratio = sw / sh
+            if img_ratio > screen_ratio:
+                # image is wider: scale by height
+                new_h = sh
+                new_w = int(img_ratio * new_h)
+            else:
+                new_w = sw
+                new_h = int(new_w / img_ratio)
+            # bilinear is plenty for a 750ms flash once draft() has done the heavy lifting
+            img = img.resize((new_w, new_h), Image.BILINEAR)
+
+            # Slight blur/sharpen to make the glitch pop -- a full-image convolution, so
+            # it stays here in the cache-fill branch and runs once per (path, screen)
+            img = img.filter(ImageFilter.UnsharpMask(radius=1, percent=50, threshold=2))
+
+            # the module-level cache also anchors the PhotoImage so Tk never loses it to GC
+            cached = (img, np.asarray(img), ImageTk.PhotoImage(img))
+            _GLITCH_IMG_CACHE[key] = cached
+        img, img_arr, photo = cached
+        new_w, new_h = img.size
 
         # center image
         x0 = (sw - new_w) // 2
@@ -116,52 +178,84 @@ def show_image_glitch(root, image_path, duration_ms=750, noise_pixels=800, flick
         # keep a reference to avoid GC
         canvas.photo = photo
 
+        # Pixel disorder is painted into one screen-sized RGBA buffer and shown as a
+        # single image item on top of the picture, instead of one canvas rectangle
+        # per sampled pixel (hundreds of Tcl calls per flicker). Buffer and PhotoImage
+        # live on the pooled window like the canvas; each glitch just clears them.
+        noise_buf = getattr(win, "noise_buf", None)
+        if noise_buf is None or noise_buf.shape[:2] != (sh, sw):
+            noise_buf = win.noise_buf = np.zeros((sh, sw, 4), dtype=np.uint8)
+            win.noise_photo = ImageTk.PhotoImage("RGBA", (sw, sh))
+        else:
+            noise_buf[:] = 0
+        noise_photo = win.noise_photo
+        noise_photo.paste(Image.fromarray(noise_buf))
+        canvas.create_image(0, 0, anchor="nw", image=noise_photo)
+
+        # Sample every pixel the whole flicker sequence will use up front: one RNG
+        # draw per axis and a single gather from the image array per glitch.
+        per_flicker = int(noise_pixels / 3)
+        final_burst = int(noise_pixels * 0.7)
+        total = flicker_times * per_flicker + final_burst
+        rx = np.random.randint(0, new_w, total)
+        ry = np.random.randint(0, new_h, total)
+        samples = img_arr[ry, rx]
+        samples[:, 3] = 255
+        # map to screen coords
+        scr_x = rx + x0
+        scr_y = ry + y0
+        used = [0]
+
         # A small helper to add pixel disorder using sampled colors from the image:
-        def add_pixel_noise(count=noise_pixels, rect_size=(2, 6)):
-            # sample random pixels from the resized Pillow image
-            for _ in range(count):
-                rx = random.randint(0, new_w - 1)
-                ry = random.randint(0, new_h - 1)
-                px = img.getpixel((rx, ry))
-                # convert tuple to hex color (supports RGBA)
-                color = f"#{px[0]:02x}{px[1]:02x}{px[2]:02x}"
-                # map to screen coords
-                sx = x0 + rx
-                sy = y0 + ry
-                w = random.randint(rect_size[0], rect_size[1])
-                h = random.randint(rect_size[0], rect_size[1])
-                # draw tiny block
-                canvas.create_rectangle(sx, sy, sx + w, sy + h, fill=color, outline=color)
+        def add_pixel_noise(count, block=4):
+            # take the next `count` pre-drawn samples
+            start = used[0]
+            used[0] += count
+            sx = scr_x[start:start + count]
+            sy = scr_y[start:start + count]
+            colors = samples[start:start + count]
+            # drop blocks that would fall off screen
+            keep = (sx >= 0) & (sx <= sw - block) & (sy >= 0) & (sy <= sh - block)
+            sx, sy, colors = sx[keep], sy[keep], colors[keep]
+            # draw tiny blocks: (count, block, block) index grids, one fancy assignment
+            offs = np.arange(block)
+            noise_buf[sy[:, None, None] + offs[None, :, None],
+                      sx[:, None, None] + offs[None, None, :]] = colors[:, None, None, :]
+            # push into the existing Tk image; the canvas item picks it up
+            noise_photo.paste(Image.fromarray(noise_buf))
 
         # Flicker sequence: show image, add quick noise layers and small flashes
+        flash_bgs = random.choices(["#000000", "#111111", "#060606", "#1a1a1a"], k=flicker_times)
 
         def flicker_step(i=0):
             if i >= flicker_times:
-                # final tiny noise burst, then schedule destroy
-                add_pixel_noise(int(noise_pixels * 0.7), rect_size=(1, 5))
-                win.after(duration_ms - 100, lambda: (win.destroy() if win.winfo_exists() else None))
+                # final tiny noise burst, then schedule hide
+                add_pixel_noise(final_burst)
+                win.after(duration_ms - 100, hide)
                 return
             # small random background flash to sell the effect
             try:
-                flash_bg = random.choice(["#000000", "#111111", "#060606", "#1a1a1a"])
-                canvas.configure(bg=flash_bg)
+                canvas.configure(bg=flash_bgs[i])
             except Exception:
                 pass
             # add quick pixel noise overlay
-            add_pixel_noise(int(noise_pixels / 3), rect_size=(1, 4))
+            add_pixel_noise(per_flicker, block=3)
             # short pause between flickers
             win.after(int(duration_ms / max(4, flicker_times * 2)), lambda: flicker_step(i + 1))
 
+        win.deiconify()
+        win.lift()
+
         # Start the flicker/noise and ensure removal
         win.after(50, lambda: flicker_step(0))
         # ensure cleanup in case timing drifts
-        win.after(duration_ms + 250, lambda: (win.destroy() if win.winfo_exists() else None))
+        win.after(duration_ms + 250, hide)
 
     except Exception:
         # Fail gracefully if Pillow or tk operations throw — no crash
         try:
             if 'win' in locals() and win.winfo_exists():
-                win.destroy()
+                win.withdraw()
         except Exception:
             pass
 
@@ -195,6 +289,33 @@ EXTRA_BTN_ACTIVE = "#553322"
 YELLOW_BTN_BG = "#6b5d20"   # yellowish Emergency/Help
 YELLOW_BTN_ACTIVE = "#8a7a30"
 
+# two-digit hex for every 8-bit channel value, so animated colors are built
+# with "#" + _HEX[r] + _HEX[g] + _HEX[b] instead of a format() per frame
+_HEX = [f"{i:02x}" for i in range(256)]
+
+# -------------------------
+# Fonts
+# -------------------------
+_UI_FAMILY = "Segoe UI" if sys.platform.startswith("win") else "Helvetica"
+
+
+def _get_fonts(root):
+    """
+    Named fonts for the main window and the overlay, created once per Tk root and
+    kept on it (root._fonts), so they go away with that interpreter.
+    """
+    fonts = getattr(root, "_fonts", None)
+    if fonts is None:
+        fonts = root._fonts = {
+            "title": tkfont.Font(root, family=_UI_FAMILY, size=40, weight="bold"),
+            "sub": tkfont.Font(root, family=_UI_FAMILY, size=12),
+            "note": tkfont.Font(root, family=_UI_FAMILY, size=10),
+            "overlay": tkfont.Font(root, family=_UI_FAMILY, size=56, weight="bold"),
+            "dots": tkfont.Font(root, size=48),
+            "badge": tkfont.Font(root, size=18, weight="bold"),
+        }
+    return fonts
+
 # -------------------------
 # Secret code (new per run)
 # -------------------------
@@ -203,6 +324,12 @@ def new_secret_code():
 
 
 SECRET_CODE = new_secret_code()
+
+# the login name can't change while we run; look it up once
+try:
+    _USERNAME = getpass.getuser()
+except Exception:
+    _USERNAME = "User"
 # print("DEBUG SECRET_CODE:", SECRET_CODE)
 
 
@@ -220,6 +347,68 @@ def panic_exit(event=None):
     os._exit(0)
 
 
+def on_panic_key(event):
+    """Single Ctrl+Shift binding for the panic key; keysym is 'K', or 'k' with Caps Lock."""
+    if event.keysym in ("K", "k"):
+        panic_exit(event)
+
+
+# host -> idle keep-alive HTTPSConnection, so repeat lookups skip the TLS handshake
+_IP_CONNECTIONS = {}
+
+
+def _query_ip_service(url, timeout, redirects=1):
+    """
+    Ask one IP geolocation service; returns (city, country), either may be ''.
+    Unlike urlopen, http.client doesn't follow redirects, so up to `redirects`
+    3xx answers with a Location header are followed here.
+    """
+    parts = urlsplit(url)
+    host, path = parts.netloc, parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    # take the connection out of the pool so concurrent lookups never share one
+    conn = _IP_CONNECTIONS.pop(host, None)
+    reused = conn is not None
+    while True:
+        if conn is None:
+            conn = http.client.HTTPSConnection(host, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        try:
+            conn.request("GET", path, headers={"User-Agent": "matrix-prank/1.0"})
+            resp = conn.getresponse()
+            raw = resp.read().decode("utf-8", errors="ignore")
+            break
+        except (http.client.HTTPException, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # the server dropped the idle connection; retry once on a fresh one
+            conn, reused = None, False
+
+    if resp.will_close:
+        conn.close()
+    else:
+        _IP_CONNECTIONS[host] = conn
+    location = resp.getheader("Location")
+    if 300 <= resp.status < 400 and location and redirects > 0:
+        target = urljoin(url, location)
+        if urlsplit(target).scheme == "https":
+            return _query_ip_service(target, timeout, redirects - 1)
+    if resp.status != 200:
+        raise http.client.HTTPException(f"{host} answered {resp.status}")
+
+    try:
+        data = json.loads(raw)
+    except Exception:
+        data = {}
+
+    city = (data.get("city") or data.get("region") or "").strip()
+    country = (data.get("country_name") or data.get("country") or "").strip()
+    return city, country
+
+
 def fetch_ip_location(timeout=3.0):
     """Best-effort IP -> (city, country). If fails returns ('', 'Unknown')."""
     services = [
@@ -228,28 +417,83 @@ def fetch_ip_location(timeout=3.0):
         "https://ipwho.is/"
     ]
 
-    for url in services:
-        try:
-            req = urllib.request.Request(url, headers={"User-Agent": "matrix-prank/1.0"})
-            with urllib.request.urlopen(req, timeout=timeout) as resp:
-                raw = resp.read().decode("utf-8", errors="ignore")
+    # ask all services at once and take the first full answer, so the worst case
+    # is one timeout instead of one per service
+    pool = ThreadPoolExecutor(max_workers=len(services))
+    futures = [pool.submit(_query_ip_service, url, timeout) for url in services]
+    country_only = ""
+    try:
+        for fut in as_completed(futures, timeout=timeout):
             try:
-                data = json.loads(raw)
+                city, country = fut.result()
             except Exception:
-                data = {}
-
-            city = (data.get("city") or data.get("region") or "").strip()
-            country = (data.get("country_name") or data.get("country") or "").strip()
+                continue
             if city and country:
                 return city, country
-            if country:
-                return "", country
-        except Exception:
-            continue
+            if country and not country_only:
+                country_only = country
+    except FuturesTimeout:
+        pass
+    finally:
+        # don't wait for the stragglers; their sockets time out on their own
+        pool.shutdown(wait=False, cancel_futures=True)
 
+    if country_only:
+        return "", country_only
     return "", "Unknown"
 
 
+def screen_size(root):
+    """Screen (width, height), cached on root by run_app; falls back to asking Tk."""
+    try:
+        return root._screen_w, root._screen_h
+    except AttributeError:
+        return root.winfo_screenwidth(), root.winfo_screenheight()
+
+
+def ask_yes_no_async(parent, title, message, on_yes, on_no=None):
+    """
+    Non-modal Yes/No prompt. Returns the Toplevel right away and later calls
+    on_yes / on_no (closing the window counts as No) from the button press.
+    """
+    top = tk.Toplevel(parent)
+    top.title(title)
+    top.configure(bg=BG)
+    top.resizable(False, False)
+    try:
+        top.transient(parent)
+    except Exception:
+        pass
+
+    def answer(callback):
+        try:
+            top.destroy()
+        except Exception:
+            pass
+        if callback is not None:
+            callback()
+
+    tk.Label(top, text=message, fg=TEXT_COLOR, bg=BG, padx=24, pady=16).pack()
+    row = tk.Frame(top, bg=BG)
+    row.pack(pady=(0, 14))
+    tk.Button(row, text="Yes", width=10, command=lambda: answer(on_yes),
+              bg=BTN_BG, fg=TEXT_COLOR, activebackground=BTN_ACTIVE).pack(side="left", padx=8)
+    tk.Button(row, text="No", width=10, command=lambda: answer(on_no),
+              bg=BTN_BG, fg=TEXT_COLOR, activebackground=BTN_ACTIVE).pack(side="left", padx=8)
+    top.protocol("WM_DELETE_WINDOW", lambda: answer(on_no))
+    # center over the parent, like messagebox.askyesno does
+    try:
+        top.update_idletasks()
+        w, h = top.winfo_reqwidth(), top.winfo_reqheight()
+        x = parent.winfo_rootx() + (parent.winfo_width() - w) // 2
+        y = parent.winfo_rooty() + (parent.winfo_height() - h) // 2
+        top.geometry(f"+{max(0, x)}+{max(0, y)}")
+    except Exception:
+        pass
+    bring_to_front(top)
+    return top
+
+
 def bring_to_front(win):
     """Try to bring a window to the front gracefully."""
     if win is None:
@@ -260,7 +504,9 @@ def bring_to_front(win):
         try:
             win.attributes("-topmost", True)
             win.focus_force()
-            win.after(150, lambda: win.attributes("-topmost", False))
+            # a window that is meant to stay on top keeps it
+            if not getattr(win, "_keep_topmost", False):
+                win.after(150, lambda: win.attributes("-topmost", False))
         except Exception:
             # fallback
             win.focus_force()
@@ -275,54 +521,63 @@ def bring_to_front(win):
 # Dense Binary rain canvas
 # -------------------------
 class BinaryRainCanvas(tk.Canvas):
-    def __init__(self, parent, width, height, speed=35, **kwargs):
+    def __init__(self, parent, width, height, **kwargs):
         super().__init__(parent, width=width, height=height, highlightthickness=0, **kwargs)
         self.width = width
         self.height = height
-        self.speed = speed
         self.column_width = 10  # denser columns
         self.columns = max(10, int(self.width / self.column_width))
-        self.drops = [random.randint(-self.height, 0) for _ in range(self.columns)]
-        self.running = False
-
-    def start(self):
-        self.running = True
-        self._animate()
-
-    def stop(self):
-        self.running = False
-
-    def _animate(self):
-        if not self.running:
-            return
-        # clear and redraw
-        self.delete("all")
-        for i in range(self.columns):
+        # The rain is rasterized: pre-rendered "0"/"1" tiles are pasted into one PIL
+        # frame that backs a single canvas image, so the item count stays at one no
+        # matter how many columns there are.
+        self.glyphs = self._render_glyphs()
+        self.frame = Image.new("RGB", (self.width, self.height), "black")
+        self.photo = ImageTk.PhotoImage(self.frame)
+        self.create_image(0, 0, anchor="nw", image=self.photo)
+
+    def _render_glyphs(self, line_height=12):
+        # use a small monospace font (platform will fallback)
+        try:
+            font = ImageFont.truetype("consola.ttf", line_height)
+        except Exception:
+            font = ImageFont.load_default()
+        glyphs = {}
+        for ch in "01":
+            tile = Image.new("RGB", (self.column_width, line_height), "black")
+            ImageDraw.Draw(tile).text((0, 0), ch, fill="#00ff00", font=font)
+            glyphs[ch] = tile
+        return glyphs
+
+    def render_once(self):
+        """Draw a single still frame (drops scattered over the whole canvas)."""
+        self.drops = np.random.randint(24, self.height + 1, self.columns)
+        self._draw_frame()
+
+    def _draw_frame(self):
+        # clear and redraw into the off-screen frame
+        frame, glyphs = self.frame, self.glyphs
+        frame.paste("black", (0, 0, self.width, self.height))
+        bits = random.choices("01", k=3 * self.columns)
+        for i, y in enumerate(self.drops.tolist()):
             x = i * self.column_width + 4
-            y = self.drops[i]
             # draw multiple bits per column to look denser
             for k in range(3):
-                char = random.choice(["0", "1"])
-                # use a small monospace font (platform will fallback)
-                try:
-                    self.create_text(x, y - k * 12, text=char, fill="#00ff00",
-                                     font=("Consolas", 10), anchor="nw")
-                except Exception:
-                    self.create_text(x, y - k * 12, text=char, fill="#00ff00",
-                                     anchor="nw")
-            self.drops[i] += random.randint(8, 20)
-            if self.drops[i] > self.height + 40:
-                self.drops[i] = random.randint(-160, -20)
-        self.after(self.speed, self._animate)
+                frame.paste(glyphs[bits[3 * i + k]], (x, y - k * 12))
+        # push the frame into the existing Tk image; the canvas item picks it up
+        self.photo.paste(frame)
 
 
 # -------------------------
 # Binary typing notepad
 # -------------------------
 class BinaryTypingNotepad(tk.Toplevel):
+    tick_ms = 30  # shortest typing redraw interval; characters due in between are inserted together
+
     def __init__(self, master, content, font_size=28, delay=70, fade_time=1000):
         super().__init__(master)
         self.master = master
+        # owned by master so it stays above it when master is kept topmost
+        self.transient(master)
         self.content = content
         self.delay = delay
         self.fade_time = fade_time
@@ -331,7 +586,7 @@ class BinaryTypingNotepad(tk.Toplevel):
         self.title("Notepad")
 
         W, H = 920, 480
-        sw, sh = self.winfo_screenwidth(), self.winfo_screenheight()
+        sw, sh = screen_size(master)
         self.geometry(f"{W}x{H}+{(sw-W)//2}+{(sh-H)//2}")
         self.configure(bg=BG)
 
@@ -347,7 +602,12 @@ class BinaryTypingNotepad(tk.Toplevel):
         self.text_widget = scrolledtext.ScrolledText(frame, wrap="word", font=txt_font,
                                                      bg=BG, fg="#ff2222", insertbackground="#ff6666")
         self.text_widget.pack(fill="both", expand=True)
-        self.text_widget.configure(state="disabled")
+        # read-only while typing: swallow edits instead of toggling state around each insert
+        self.text_widget.bind("<Key>", self._swallow_key)
+        self.text_widget.bind("<<PasteSelection>>", lambda e: "break")
+        # no insert cursor (and so no blink timer) until typing is done
+        self._insert_ontime = self.text_widget.cget("insertontime")
+        self.text_widget.configure(insertontime=0)
 
         # Close button inert during typing
         bottom = tk.Frame(self, bg=BG)
@@ -357,10 +617,19 @@ class BinaryTypingNotepad(tk.Toplevel):
         self.close_btn.pack(side="right", padx=8, pady=6)
         self.protocol("WM_DELETE_WINDOW", lambda: self.inert_close())
 
-        # Start animations & typing
-        self.canvas.start()
+        # Binary background is rendered once: the text frame covers all but a thin
+        # border of it, so re-rasterizing the whole rain every 35ms is wasted work
+        # while typing. Typing itself only inserts into the Text widget on top.
+        self.canvas.render_once()
         # small delay before typing
-        self.after(180, self._type_next_char)
+        self.after(180, self._start_typing)
+
+    @staticmethod
+    def _swallow_key(event):
+        # "break" also skips the "all" bind tag, so hand the panic key on ourselves
+        if event.state & 0x5 == 0x5:  # Shift + Control
+            on_panic_key(event)
+        return "break"
 
     def inert_close(self):
         if self.typing_running:
@@ -375,12 +644,42 @@ class BinaryTypingNotepad(tk.Toplevel):
             except Exception:
                 pass
 
-    def _type_next_char(self):
+    def _start_typing(self):
+        self._start_ms = time.monotonic() * 1000.0
+        self._next_due = 0.0  # virtual ms (since start) at which the next character is due
+        self._last_see_idx = 0
+        self._type_tick()
+
+    def _type_tick(self):
+        elapsed = time.monotonic() * 1000.0 - self._start_ms
+        first = self.idx
+        # take every character that came due since the last tick
+        while self.idx < len(self.content) and self._next_due <= elapsed:
+            ch = self.content[self.idx]
+            self.idx += 1
+            # some delay sweetening for punctuation and newlines
+            extra = 160 if ch in ".!?" else (70 if ch == "\n" else 0)
+            self._next_due += max(10, self.delay + extra)
+
+        if self.idx > first:
+            chunk = self.content[first:self.idx]
+            try:
+                self.text_widget.insert("end", chunk)
+                # only scroll on new lines, every 40 chars, or at the very end
+                if ("\n" in chunk or self.idx - self._last_see_idx >= 40
+                        or self.idx >= len(self.content)):
+                    self.text_widget.see("end")
+                    self._last_see_idx = self.idx
+            except Exception:
+                pass
+
         # finished
         if self.idx >= len(self.content):
             self.typing_running = False
             try:
-                self.text_widget.configure(state="normal")
+                for seq in ("<Key>", "<<PasteSelection>>"):
+                    self.text_widget.unbind(seq)
+                self.text_widget.configure(insertontime=self._insert_ontime)
             except Exception:
                 pass
             self.text_widget.mark_set("insert", "end")
@@ -388,29 +687,25 @@ class BinaryTypingNotepad(tk.Toplevel):
             self.after(250, self._fade_background_and_enable_close)
             return
 
-        ch = self.content[self.idx]
-        try:
-            self.text_widget.configure(state="normal")
-            self.text_widget.insert("end", ch)
-            self.text_widget.see("end")
-            self.text_widget.configure(state="disabled")
-        except Exception:
-            pass
-        self.idx += 1
-
-        # some delay sweetening for punctuation and newlines
-        extra = 160 if ch in ".!?" else (70 if ch == "\n" else 0)
-        self.after(max(10, self.delay + extra), self._type_next_char)
+        # sleep until the next character is due, but never redraw more often than tick_ms
+        wait = int(self._next_due - (time.monotonic() * 1000.0 - self._start_ms))
+        self.after(max(self.tick_ms, wait), self._type_tick)
 
     def _fade_background_and_enable_close(self):
         steps = 12
         delay = max(20, int(self.fade_time / steps))
+        # one overlay rectangle, recolored on each step instead of delete + create
+        try:
+            fade_id = self.canvas.create_rectangle(0, 0, self.canvas.width, self.canvas.height,
+                                                   fill="#000000", outline="#000000",
+                                                   state="hidden", tags="fade")
+        except Exception:
+            fade_id = None
 
         def step(i=0):
             if i > steps:
                 try:
-                    self.canvas.stop()
-                    self.canvas.delete("all")
+                    self.canvas.itemconfigure("all", state="hidden")
                 except Exception:
                     pass
                 # now allow normal close
@@ -424,12 +719,9 @@ class BinaryTypingNotepad(tk.Toplevel):
             grey_level = int((i / steps) * 60)
             # ensure 0..255
             grey_level = max(0, min(255, grey_level))
-            grey = f"#{grey_level:02x}{grey_level:02x}{grey_level:02x}"
+            grey = "#" + _HEX[grey_level] * 3
             try:
-                # draw a rectangle overlay (tagged so repeated draws overwrite)
-                self.canvas.delete("fade")
-                self.canvas.create_rectangle(0, 0, self.canvas.width, self.canvas.height,
-                                             fill=grey, outline=grey, tags="fade")
+                self.canvas.itemconfigure(fade_id, fill=grey, outline=grey, state="normal")
             except Exception:
                 pass
             self.after(delay, lambda: step(i + 1))
@@ -440,6 +732,22 @@ class BinaryTypingNotepad(tk.Toplevel):
 # -------------------------
 # Secret helpers (Clue Finder & Trivia Helper behavior)
 # -------------------------
+# Question pools; answers are casefolded once here so each check only folds the reply.
+# Trivia Helper: 5 moderately hard but solvable questions
+TRIVIA_QUESTIONS = [(q, a.casefold()) for q, a in [
+    ("What is the atomic number of gold?", "79"),
+    ("Which planet has the most moons (as of 2023)?", "saturn"),
+    ("What is the capital city of Peru?", "lima"),
+    ("In computing, what does 'CPU' stand for?", "central processing unit"),
+    ("What is the approximate value of pi to 2 decimal places?", "3.14"),
+    ("What year did the Berlin Wall fall?", "1989"),
+    ("Which element has chemical symbol 'Na'?", "sodium"),
+    ("Who wrote '1984'?", "george orwell"),
+    ("What is the largest ocean on Earth?", "pacific"),
+    ("What language is primarily spoken in Brazil?", "portuguese")
+]]
+
+
 class SecretHelpers:
     def __init__(self, root, secret_code):
         self.root = root
@@ -462,23 +770,11 @@ class SecretHelpers:
 
     def trivia_helper(self):
         # ask 5 moderately hard but solvable questions; if all 5 correct reveal remaining digits
-        qpool = [
-            ("What is the atomic number of gold?", "79"),
-            ("Which planet has the most moons (as of 2023)?", "saturn"),
-            ("What is the capital city of Peru?", "lima"),
-            ("In computing, what does 'CPU' stand for?", "central processing unit"),
-            ("What is the approximate value of pi to 2 decimal places?", "3.14"),
-            ("What year did the Berlin Wall fall?", "1989"),
-            ("Which element has chemical symbol 'Na'?", "sodium"),
-            ("Who wrote '1984'?", "george orwell"),
-            ("What is the largest ocean on Earth?", "pacific"),
-            ("What language is primarily spoken in Brazil?", "portuguese")
-        ]
-        picks = random.sample(qpool, 5)
+        picks = random.sample(TRIVIA_QUESTIONS, 5)
         correct = 0
         for q, a in picks:
             ans = simpledialog.askstring("Trivia Helper", q, parent=self.root)
-            if ans and ans.strip().lower() == a.lower():
+            if ans and ans.strip().casefold() == a:
                 correct += 1
 
         if correct == 5:
@@ -496,33 +792,35 @@ class SecretHelpers:
 # -------------------------
 # Emergency quiz: 10 harder questions; must be all correct to prompt for code entry
 # -------------------------
+EMERGENCY_QUESTIONS = [(q, a.casefold()) for q, a in [
+    ("What is the capital of Iceland?", "reykjavik"),
+    ("What year did the Titanic sink?", "1912"),
+    ("What is the chemical formula for table salt?", "nacl"),
+    ("Who painted the Mona Lisa?", "leonardo da vinci"),
+    ("Which gas makes up ~78% of Earth's atmosphere?", "nitrogen"),
+    ("What is the largest planet in our solar system?", "jupiter"),
+    ("What is the square root of 144?", "12"),
+    ("Which metal has the highest electrical conductivity?", "silver"),
+    ("In which country is the Taj Mahal located?", "india"),
+    ("Who proposed the theory of general relativity?", "albert einstein"),
+    ("What is the freezing point of water in Celsius?", "0"),
+    ("Which city hosted the 2012 Summer Olympics?", "london"),
+    ("What currency is used in Japan?", "yen"),
+    ("What is the chemical symbol for iron?", "fe"),
+    ("Which scientist discovered penicillin?", "alexander fleming")
+]]
+
+
 def emergency_quiz_flow(root, secret_code):
     if not messagebox.askyesno("Emergency", "Start the emergency quiz (10 questions)?"):
         bring_to_front(root)
         return
 
-    qpool = [
-        ("What is the capital of Iceland?", "reykjavik"),
-        ("What year did the Titanic sink?", "1912"),
-        ("What is the chemical formula for table salt?", "nacl"),
-        ("Who painted the Mona Lisa?", "leonardo da vinci"),
-        ("Which gas makes up ~78% of Earth's atmosphere?", "nitrogen"),
-        ("What is the largest planet in our solar system?", "jupiter"),
-        ("What is the square root of 144?", "12"),
-        ("Which metal has the highest electrical conductivity?", "silver"),
-        ("In which country is the Taj Mahal located?", "india"),
-        ("Who proposed the theory of general relativity?", "albert einstein"),
-        ("What is the freezing point of water in Celsius?", "0"),
-        ("Which city hosted the 2012 Summer Olympics?", "london"),
-        ("What currency is used in Japan?", "yen"),
-        ("What is the chemical symbol for iron?", "fe"),
-        ("Which scientist discovered penicillin?", "alexander fleming")
-    ]
-    picks = random.sample(qpool, 10)
+    picks = random.sample(EMERGENCY_QUESTIONS, 10)
     correct = 0
     for q, a in picks:
         ans = simpledialog.askstring("Emergency Quiz", q, parent=root)
-        if ans and ans.strip().lower() == a.lower():
+        if ans and ans.strip().casefold() == a:
             correct += 1
 
     wrong = 10 - correct
@@ -547,6 +845,10 @@ def emergency_quiz_flow(root, secret_code):
 # -------------------------
 # Overlay (close/minimize abuse)
 # -------------------------
+# how long the overlay stays up after repeated close/minimize attempts: 9-17s
+_OVERLAY_DURS = tuple(range(9000, 18000, 1000))
+
+
 def show_overlay_then_reset(root, duration_ms):
     if getattr(root, "overlay_open", False):
         bring_to_front(getattr(root, "active_overlay", None))
@@ -558,7 +860,7 @@ def show_overlay_then_reset(root, duration_ms):
         overlay.attributes("-fullscreen", True)
     except Exception:
         # fallback to covering the screen manually
-        sw, sh = overlay.winfo_screenwidth(), overlay.winfo_screenheight()
+        sw, sh = screen_size(root)
         overlay.geometry(f"{sw}x{sh}+0+0")
     try:
         overlay.attributes("-topmost", True)
@@ -568,21 +870,22 @@ def show_overlay_then_reset(root, duration_ms):
     root.overlay_open = True
     root.active_overlay = overlay
 
-    bigf = tkfont.Font(family="Segoe UI" if sys.platform.startswith("win") else "Helvetica", size=56, weight="bold")
+    fonts = _get_fonts(root)
+    bigf = fonts["overlay"]
     lbl = tk.Label(overlay, text="- Security Center -\nPotential threat detected:\ntaking protective actions",
                    font=bigf, fg="#ff3333", bg="black", justify="center")
     lbl.pack(pady=(80, 10))
 
-    dotf = tkfont.Font(size=48)
+    dotf = fonts["dots"]
     dot_lbl = tk.Label(overlay, text="", font=dotf, fg="#ff6666", bg="black")
     dot_lbl.pack()
 
-    badgef = tkfont.Font(size=18, weight="bold")
+    badgef = fonts["badge"]
     badge_box = tk.Label(overlay, text="🛡️ Microsoft Security", font=badgef,
                          fg="#ffdcdc", bg="#222222", padx=12, pady=8)
     badge_box.pack(pady=(30, 6))
 
-    patent_label = tk.Label(overlay, text="(System Integrity Warning\nProtecting your files...)", font=("Segoe UI", 10), fg="#999999", bg="black")
+    patent_label = tk.Label(overlay, text="(System Integrity Warning\nProtecting your files...)", font=fonts["note"], fg="#999999", bg="black")
     patent_label.pack()
 
     steps = ["", ".", "..", "..."]
@@ -615,6 +918,33 @@ def show_overlay_then_reset(root, duration_ms):
 GLITCH_MIN_DELAY = 8000   # minimum time between glitches (ms)
 GLITCH_MAX_DELAY = 15000  # maximum time between glitches (ms)
 GLITCH_DURATION = 2000    # how long glitch visuals last (ms)
+GLITCH_STYLES = ("matrix", "cyber_red", "tv_static", "image_glitch")
+GLITCH_IMAGE_MAX_PIXELS = 4_000_000  # above this, the image glitch needs Pillow-SIMD
+
+# pre-drawn 3-8s gaps between automatic glitches (ms); cycled, reshuffled every lap
+_GLITCH_JITTERS = [random.randint(3000, 8000) for _ in range(256)]
+_gi = [0]
+
+
+def _next_glitch_gap():
+    i = _gi[0]
+    _gi[0] = (i + 1) & 255
+    if _gi[0] == 0:
+        random.shuffle(_GLITCH_JITTERS)
+    return _GLITCH_JITTERS[i]
+
+
+def glitch_styles_for_screen(screen_w, screen_h):
+    """
+    Pick the static_overlay styles this machine can afford. The fullscreen image
+    glitch decodes, resizes and blits a screen-sized picture, so it is dropped on
+    big (>4MP) displays unless Pillow-SIMD ("x.y.z.postN" versions) is installed.
+    """
+    pillow_simd = ".post" in PIL.__version__
+    if screen_w * screen_h > GLITCH_IMAGE_MAX_PIXELS and not pillow_simd:
+        return tuple(s for s in GLITCH_STYLES if s != "image_glitch")
+    return GLITCH_STYLES
+
 
 # -------------------------
 # Visual glitch effect (shake + flicker + static)
@@ -667,23 +997,27 @@ def start_visual_glitch(root):
             root.after(50, static_overlay)
             return
 
-        overlay = tk.Canvas(root, width=w, height=h, highlightthickness=0, bg="", bd=0)
+        overlay = tk.Canvas(root, width=w, height=h, highlightthickness=0, bg="black", bd=0)
         overlay.place(x=0, y=0)
 
-        # choose style: matrix (green), red/cyber, tv (dots/lines)
-        style = random.choice(["cyber", "tv", "bars", "image_glitch"])
+        # choose style: matrix (green), red/cyber, tv (dots/lines), or image glitch
+        style = random.choice(getattr(root, "glitch_styles", GLITCH_STYLES))
+
+        # Non-image styles are drawn into one transparent RGBA frame with PIL/NumPy and
+        # shown as a single canvas image, instead of hundreds of canvas items.
+        frame = None
 
         if style == "matrix":
             # dense green bits + faint vertical lines to mimic matrix rain
-            for _ in range(200):
-                x = random.randint(0, w)
-                y = random.randint(0, h)
-                hgt = random.randint(6, 30)
-                overlay.create_text(x, y, text=random.choice(["0", "1"]), anchor="nw", font=("Consolas", 8), fill="#00ff66")
+            frame = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(frame)
+            xs = np.random.randint(0, w + 1, 200).tolist()
+            ys = np.random.randint(0, h + 1, 200).tolist()
+            for x, y, bit in zip(xs, ys, random.choices("01", k=200)):
+                draw.text((x, y), bit, fill="#00ff66")
             # a few vertical translucent lines
-            for _ in range(6):
-                x = random.randint(0, w)
-                overlay.create_rectangle(x, 0, x+2, h, fill="#003300", outline="")
+            for x in np.random.randint(0, w + 1, 6).tolist():
+                draw.rectangle((x, 0, x + 1, h - 1), fill="#003300")
 
         elif style == "cyber_red":
             # colored blocks, horizontal bars, and RGB offset rectangles
@@ -693,35 +1027,50 @@ def start_visual_glitch(root):
                 ["#00ffcc", "#00ccff", "#0066ff"]    # cyan/blue
             ]
             colors = random.choice(palette)
-            for _ in range(60):
-                x1 = random.randint(0, w)
-                y1 = random.randint(0, h)
-                x2 = x1 + random.randint(10, 120)
-                y2 = y1 + random.randint(6, 40)
-                c = random.choice(colors)
-                overlay.create_rectangle(x1, y1, x2, y2, fill=c, outline="")
+            frame = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+            draw = ImageDraw.Draw(frame)
+            x1s = np.random.randint(0, w + 1, 60)
+            y1s = np.random.randint(0, h + 1, 60)
+            x2s = x1s + np.random.randint(10, 121, 60)
+            y2s = y1s + np.random.randint(6, 41, 60)
+            blocks = zip(x1s.tolist(), y1s.tolist(), x2s.tolist(), y2s.tolist(),
+                         random.choices(colors, k=60))
+            for x1, y1, x2, y2, c in blocks:
+                draw.rectangle((x1, y1, x2 - 1, y2 - 1), fill=c)
 
             # a few thin vertical neon lines for tearing effect
-            for _ in range(5):
-                x = random.randint(0, w)
-                overlay.create_rectangle(x, 0, x + random.randint(2,5), h, fill=random.choice(colors), outline="")
+            lines = zip(np.random.randint(0, w + 1, 5).tolist(), np.random.randint(2, 6, 5).tolist(),
+                        random.choices(colors, k=5))
+            for x, lw, c in lines:
+                draw.rectangle((x, 0, x + lw - 1, h - 1), fill=c)
 
         elif style == "tv_static":
             # gray/white pixel noise + horizontal scan bars
-            for _ in range(1200):
-                x = random.randint(0, w)
-                y = random.randint(0, h)
-                gray = random.choice(["#AAAAAA", "#BBBBBB", "#CCCCCC", "#EEEEEE", "#FFFFFF"])
-                overlay.create_rectangle(x, y, x + 1, y + 1, fill=gray, outline=gray)
+            buf = np.zeros((h, w, 4), dtype=np.uint8)
+            xs = np.random.randint(0, max(1, w - 1), 1200)
+            ys = np.random.randint(0, max(1, h - 1), 1200)
+            grays = np.random.choice(np.array([0xAA, 0xBB, 0xCC, 0xEE, 0xFF], dtype=np.uint8), 1200)
+            # 2x2 dots, like the old 1px rectangles with a 1px outline
+            for dy in (0, 1):
+                for dx in (0, 1):
+                    buf[ys + dy, xs + dx, :3] = grays[:, None]
+                    buf[ys + dy, xs + dx, 3] = 255
             # a few horizontal neon scan lines
             for _ in range(8):
                 y = random.randint(0, h)
-                overlay.create_rectangle(0, y, w, y + random.randint(1,4), fill=random.choice(["#ff0077", "#00ffee", "#ffff00"]), outline="")
+                color = ImageColor.getrgb(random.choice(["#ff0077", "#00ffee", "#ffff00"]))
+                buf[y:y + random.randint(1, 4)] = color + (255,)
+            frame = Image.fromarray(buf)
 
         elif style == "image_glitch":
             # show your uploaded image briefly as a fullscreen glitch
             show_image_glitch(root, "/mnt/data/Download.jpg", duration_ms=750)
 
+        if frame is not None:
+            photo = ImageTk.PhotoImage(frame)
+            overlay.create_image(0, 0, anchor="nw", image=photo)
+            # keep a reference to avoid GC
+            overlay.photo = photo
 
         # slight background flash to sell effect
         try:
@@ -733,30 +1082,46 @@ def start_visual_glitch(root):
         root.after(GLITCH_DURATION, lambda: overlay.destroy() if overlay.winfo_exists() else None)
         # --- Optional realistic photo fade-in/fade-out ---
         def show_realistic_flash():
-            import time
-            from PIL import Image, ImageTk
-
-            # full overlay on top of glitch canvas
-            flash = tk.Toplevel(root)
-            flash.attributes("-fullscreen", True)
-            flash.attributes("-topmost", True)
+            # full overlay on top of glitch canvas (one pooled window, re-shown each time)
+            flash = _pooled_fullscreen(root, "_flash_toplevel", frameless=False)
             flash.configure(bg="black")
+            flash.show_token += 1
+            token = flash.show_token
 
-            screen_w = flash.winfo_screenwidth()
-            screen_h = flash.winfo_screenheight()
-
-            # Load your local image (update filename!)
-            img = Image.open("Download.jpg")
-            img = img.resize((int(screen_w * 0.6), int(screen_h * 0.6)))
-            photo = ImageTk.PhotoImage(img)
+            screen_w, screen_h = screen_size(root)
 
-            lbl = tk.Label(flash, image=photo, bg="black")
+            # Load your local image (update filename!) -- decoded and resized once,
+            # shared with the image glitch cache
+            size = (int(screen_w * 0.6), int(screen_h * 0.6))
+            key = ("flash", "Download.jpg") + size
+            cached = _GLITCH_IMG_CACHE.get(key)
+            if cached is None:
+                try:
+                    img = Image.open("Download.jpg").resize(size)
+                except Exception:
+                    # no photo next to the script: skip the flash
+                    return
+                cached = (img, None, ImageTk.PhotoImage(img))
+                _GLITCH_IMG_CACHE[key] = cached
+            photo = cached[2]
+
+            lbl = getattr(flash, "label", None)
+            if lbl is None:
+                lbl = tk.Label(flash, bg="black")
+                lbl.place(relx=0.5, rely=0.5, anchor="center")
+                flash.label = lbl
+            lbl.configure(image=photo)
             lbl.image = photo
-            lbl.place(relx=0.5, rely=0.5, anchor="center")
+
+            flash.attributes("-alpha", 0.0)
+            flash.deiconify()
 
             # fade in/out loop
             steps = 20
             def fade(i=0):
+                if flash.show_token != token:
+                    # a newer flash took over the window
+                    return
                 if i <= steps:
                     alpha = i / steps
                     flash.attributes("-alpha", alpha)
@@ -766,11 +1131,13 @@ def start_visual_glitch(root):
                     flash.attributes("-alpha", alpha)
                     flash.after(40, lambda: fade(i + 1))
                 else:
-                    flash.destroy()
+                    _hide_pooled(flash, token)
             fade()
 
-        # call flash right after static glitch starts
-        root.after(250, show_realistic_flash)
+        # call flash right after static glitch starts -- unless the image glitch is
+        # already covering the screen, so the two fullscreen effects never stack
+        if style != "image_glitch":
+            root.after(250, show_realistic_flash)
 
     # start the sequence
     shake()
@@ -787,31 +1154,50 @@ def run_app():
     root.title("Can I hack you?")
     W, H = 760, 360
     sw, sh = root.winfo_screenwidth(), root.winfo_screenheight()
+    # cache the screen size for the overlays/glitches (see screen_size)
+    root._screen_w, root._screen_h = sw, sh
     root.geometry(f"{W}x{H}+{(sw-W)//2}+{(sh-H)//2}")
+    # Windows: pin the window topmost through Tk for the whole session; the FocusOut
+    # handler (see below) then skips its brief -topmost toggle. _keep_topmost tells
+    # bring_to_front and that handler not to clear it again.
+    root._keep_topmost = False
+    if sys.platform.startswith("win"):
+        try:
+            root.attributes("-topmost", True)
+            root._keep_topmost = True
+        except Exception:
+            pass
+    root.glitch_styles = glitch_styles_for_screen(sw, sh)
     root.resizable(False, False)
     root.configure(bg=BG)
 
     root.overlay_open = False
     root.active_overlay = None
     root.active_notepad = None
+    root.active_confirm = None
+    root.lookup_pending = False  # an IP lookup thread is running for a "Yes"
 
     # Panic key (works but not advertised)
-    root.bind_all("<Control-Shift-KeyPress-K>", panic_exit)
-    root.bind_all("<Control-Shift-KeyPress-k>", panic_exit)
+    root.bind_all("<Control-Shift-KeyPress>", on_panic_key)
+
+    # Helpers (clue & trivia share the same secret code), built on first use
+    _helpers_cache = [None]
 
-    # Prepare helpers (clue & trivia will share the same secret code)
-    helpers = SecretHelpers(root, SECRET_CODE)
+    def get_helpers():
+        if _helpers_cache[0] is None:
+            _helpers_cache[0] = SecretHelpers(root, SECRET_CODE)
+        return _helpers_cache[0]
 
     # Header
-    title_font = tkfont.Font(family="Segoe UI" if sys.platform.startswith("win") else "Helvetica",
-                             size=40, weight="bold")
+    fonts = _get_fonts(root)
+    title_font = fonts["title"]
     header = tk.Label(root, text="Can I hack you?", font=title_font, fg=LABEL_COLOR, bg=BG)
     header.pack(pady=(24, 6))
-    subtitle = tk.Label(root, text="Answer honestly.", font=("Segoe UI", 12), fg=TEXT_COLOR, bg=BG)
+    subtitle = tk.Label(root, text="Answer honestly.", font=fonts["sub"], fg=TEXT_COLOR, bg=BG)
     subtitle.pack()
 
     # Buttons
-    sub_font = tkfont.Font(family="Segoe UI" if sys.platform.startswith("win") else "Helvetica", size=12)
+    sub_font = fonts["sub"]
     btn_frame = tk.Frame(root, bg=BG)
     btn_frame.pack(pady=(14, 12))
     yes_btn = tk.Button(btn_frame, text="Yes", width=14, height=2, font=sub_font,
@@ -824,101 +1210,175 @@ def run_app():
     # Helper buttons (clue & trivia)
     helper_frame = tk.Frame(root, bg=BG)
     helper_frame.pack(pady=(8, 6))
-    clue_btn = tk.Button(helper_frame, text="Clue Finder", width=14, command=helpers.clue_finder,
+    clue_btn = tk.Button(helper_frame, text="Clue Finder", width=14,
+                         command=lambda: get_helpers().clue_finder(),
                          bg=EXTRA_BTN_BG, fg=TEXT_COLOR, activebackground=EXTRA_BTN_ACTIVE)
-    trivia_btn = tk.Button(helper_frame, text="Trivia Helper", width=14, command=helpers.trivia_helper,
+    trivia_btn = tk.Button(helper_frame, text="Trivia Helper", width=14,
+                           command=lambda: get_helpers().trivia_helper(),
                            bg=EXTRA_BTN_BG, fg=TEXT_COLOR, activebackground=EXTRA_BTN_ACTIVE)
     clue_btn.pack(side="left", padx=6)
     trivia_btn.pack(side="left", padx=6)
 
     # Emergency (yellow) and Help (yellow) aligned together
+    def show_help():
+        messagebox.showinfo(
+            "Help",
+            "Want to kill the menu, huh? Then find the secret code.\n\n"
+            "Pro tip (if you're a noob look away): Clue Finder, Trivia Helper and Emergency can help you.\n\n"
+            "Now close me >:("
+        )
+        bring_to_front(root)
+
     emergency_btn = tk.Button(root, text="Emergency", width=10, bg=YELLOW_BTN_BG, fg=TEXT_COLOR,
                               activebackground=YELLOW_BTN_ACTIVE,
-                              command=lambda: emergency_quiz_flow(root, SECRET_CODE))
+                              command=functools.partial(emergency_quiz_flow, root, SECRET_CODE))
     help_btn = tk.Button(root, text="Help", width=8, bg=YELLOW_BTN_BG, fg=TEXT_COLOR,
-                         activebackground=YELLOW_BTN_ACTIVE,
-                         command=lambda: (messagebox.showinfo(
-                             "Help",
-                             "Want to kill the menu, huh? Then find the secret code.\n\n"
-                             "Pro tip (if you're a noob look away): Clue Finder, Trivia Helper and Emergency can help you.\n\n"
-                             "Now close me >:("
-                         ), bring_to_front(root)))
+                         activebackground=YELLOW_BTN_ACTIVE, command=show_help)
     emergency_btn.place(relx=0.85, rely=0.98, anchor="se")
     help_btn.place(relx=0.98, rely=0.98, anchor="se")
 
     # Pulsing header colors (red tones)
-    pulse = ["#ff2e2e", "#cc2323", "#990f0f"]
-    pi = {"i": 0}
+    pulse = itertools.cycle(["#ff2e2e", "#cc2323", "#990f0f"])
+    # recolor through the Tcl command directly; skips tkinter's option-dict handling
+    hdr_path = str(header)
 
-    def pulse_label():
+    def pulse_label(_call=root.tk.call):
         try:
-            header.config(fg=pulse[pi["i"]])
-            pi["i"] = (pi["i"] + 1) % len(pulse)
+            _call(hdr_path, "configure", "-fg", next(pulse))
         except Exception:
             pass
-        root.after(350, pulse_label)
-
-    pulse_label()
 
     # Keep track of attempts (close/minimize)
     root.attempts = 0
 
+    # A messagebox spins a nested event loop, so our own handlers can fire inside
+    # it and stack more popups. One flag, set for as long as a popup is up, guards
+    # the focus/close/minimize handlers against that re-entry.
+    root._in_popup = False
+
+    def guarded_popup(show, title, message):
+        """Show a blocking messagebox unless one of ours is already open."""
+        if root._in_popup:
+            return
+        root._in_popup = True
+        try:
+            show(title, message)
+        except Exception:
+            pass
+        finally:
+            root._in_popup = False
+
+    # "Don't do this again" warning: built once, hidden, and re-shown on demand, so
+    # close/minimize spam never rebuilds a messagebox or nests an event loop
+    warn_win = tk.Toplevel(root)
+    warn_win.withdraw()
+    warn_win.transient(root)  # stacks above root even while root is topmost
+    warn_win.title("Don't")
+    warn_win.configure(bg=BG)
+    warn_win.resizable(False, False)
+
+    def dismiss_warning():
+        warn_win.withdraw()
+        bring_to_front(root)
+
+    tk.Label(warn_win, text="Don't do this again", font=sub_font, fg=LABEL_COLOR, bg=BG,
+             padx=24, pady=16).pack()
+    tk.Button(warn_win, text="OK", width=10, command=dismiss_warning,
+              bg=BTN_BG, fg=TEXT_COLOR, activebackground=BTN_ACTIVE).pack(pady=(0, 14))
+    warn_win.protocol("WM_DELETE_WINDOW", dismiss_warning)
+
+    def show_warning():
+        warn_win.deiconify()
+        bring_to_front(warn_win)
+
     # Close/minimize attempts: first warn, second shows overlay for 9-17s and then returns
     def on_close_attempt():
+        if root._in_popup:
+            return
         root.attempts += 1
         if root.attempts == 1:
-            messagebox.showwarning("Don't", "Don't do this again")
-            bring_to_front(root)
+            show_warning()
         else:
-            dur = random.randint(9, 17) * 1000
+            dur = random.choice(_OVERLAY_DURS)
             show_overlay_then_reset(root, dur)
 
-    root.protocol("WM_DELETE_WINDOW", lambda: on_close_attempt())
+    root.protocol("WM_DELETE_WINDOW", on_close_attempt)
 
     # Handle minimize/unmap attempts
-    def on_unmap(event=None):
+    root._iconic = False
+
+    def on_unmap(event=None, _choice=random.choice):
         try:
             if root.state() == "iconic":
+                root._iconic = True
+                # restore as soon as this event dispatch is done
+                root.after_idle(root.deiconify)
+                if root._in_popup:
+                    return
                 root.attempts += 1
-                root.after(50, lambda: root.deiconify())
                 if root.attempts == 1:
-                    messagebox.showwarning("Don't", "Don't do this again")
-                    bring_to_front(root)
+                    show_warning()
                 else:
-                    dur = random.randint(9, 17) * 1000
+                    dur = _choice(_OVERLAY_DURS)
                     show_overlay_then_reset(root, dur)
         except Exception:
             pass
 
+    def on_map(event=None):
+        if event is None or event.widget is root:
+            root._iconic = False
+
     root.bind("<Unmap>", on_unmap)
+    root.bind("<Map>", on_map)
 
     # Yes flow: create typing notepad with dense binary background that types username & location and opens Google Maps
     def yes_flow():
-        if not messagebox.askyesno("Confirm", "Are you sure you want to answer YES?"):
-            bring_to_front(root)
+        # non-modal confirm: the mainloop keeps servicing pulse/glitch timers while
+        # it is open instead of blocking inside messagebox.askyesno
+        if root.lookup_pending:
             return
+        confirm = root.active_confirm
+        if confirm is not None and confirm.winfo_exists():
+            bring_to_front(confirm)
+            return
+        root.active_confirm = ask_yes_no_async(root, "Confirm", "Are you sure you want to answer YES?",
+                                               on_yes=start_lookup,
+                                               on_no=lambda: bring_to_front(root))
 
-        try:
-            username = getpass.getuser()
-        except Exception:
-            username = "User"
+    def start_lookup():
+        # the IP lookup is network-bound: run it off the Tk thread so the mainloop
+        # (pulse, glitches, every callback) keeps going while it waits
+        root.lookup_pending = True
+        threading.Thread(target=fetch_then_continue, daemon=True).start()
 
+    def fetch_then_continue():
         city, country = fetch_ip_location()
-        content_lines = [
-            f"Hello, {username}",
-            "",
-            f"Approx. location: {city}, {country}",
-            f"City: {city}",
-            f"Country: {country}",
-            "",
-            "— end of report —"
-        ]
-        content = "\n".join(content_lines) + "\n"
+        # hand the result back to the Tk thread once the mainloop is idle
+        root.after_idle(lambda: yes_flow_continue(city, country))
+
+    def yes_flow_continue(city, country):
+        root.lookup_pending = False
+        username = _USERNAME
+
+        content = (
+            f"Hello, {username}\n"
+            "\n"
+            f"Approx. location: {city}, {country}\n"
+            f"City: {city}\n"
+            f"Country: {country}\n"
+            "\n"
+            "— end of report —\n"
+        )
 
         # open Google Maps to city (best-effort)
         if city:
+            # plain ASCII names like "New York" only need spaces turned into '+'
+            if city.isascii() and city.replace(" ", "").isalnum():
+                query = city.replace(" ", "+")
+            else:
+                query = quote_plus(city)
             try:
-                webbrowser.open_new_tab("https://www.google.com/maps/search/?api=1&query=" + quote_plus(city))
+                webbrowser.open_new_tab(f"https://www.google.com/maps/search/?api=1&query={query}")
             except Exception:
                 pass
 
@@ -934,35 +1394,62 @@ def run_app():
     yes_btn.config(command=yes_flow)
     no_btn.config(command=no_flow)
 
-    # Keep window always on top briefly if it loses focus
-    # Keep window always on top briefly if user clicks outside
-    def enforce_focus():
-        if not root.focus_displayof():
-            # Bring back to front
-            root.lift()
-            root.attributes("-topmost", True)
-            root.after(800, lambda: root.attributes("-topmost", False))
-            root.after(250, root.focus_force)
+    # Keep window always on top briefly if user clicks outside.
+    # Event driven: nothing runs until a widget of this app actually loses focus.
+    def refocus_if_app_lost_focus(_call=root.tk.call, _after=root.after):
+        # FocusOut also fires when focus just moves between our own widgets/windows
+        if root._in_popup or root.focus_displayof():
+            return
+        # Bring back to front
+        root.lift()
+        # a pinned-topmost root (Windows) is already on top; don't unpin it after 800ms
+        if not root._keep_topmost:
+            _call("wm", "attributes", root._w, "-topmost", 1)
+            _after(800, _call, "wm", "attributes", root._w, "-topmost", 0)
+        _after(250, root.focus_force)
 
-            # Show playful popup
-            try:
-                messagebox.showinfo("Haha >:)", "Haha you cannot close it >:)")
-            except Exception:
-                pass
+        # Show playful popup
+        guarded_popup(messagebox.showinfo, "Haha >:)", "Haha you cannot close it >:)")
 
-        root.after(500, enforce_focus)
+    def on_focus_out(event=None, _after_idle=root.after_idle):
+        # let Tk finish moving focus before asking where it went
+        _after_idle(refocus_if_app_lost_focus)
 
-    enforce_focus()  # start focus enforcement
+    root.bind_all("<FocusOut>", on_focus_out, add="+")
 
     # -------------------------
-    # Automatic 8–15s glitch loop
+    # Repeating jobs: header pulse (350ms) + automatic 3–8s glitch loop
     # -------------------------
-    def glitch_loop():
-        start_visual_glitch(root)
-        root.after(random.randint(3000, 8000), glitch_loop)
+    # Both run from one scheduler chain: each tick does whatever is due and sleeps
+    # until the next deadline, instead of keeping a separate after() timer per job.
+    due = {
+        "pulse": time.monotonic(),
+        # initial schedule for the first glitch
+        "glitch": time.monotonic() + _next_glitch_gap() / 1000,
+    }
+
+    # hot callbacks bind what they call as default args (local lookups, not globals)
+    def tick(_after=root.after, _now=time.monotonic, _glitch=start_visual_glitch,
+             _gap=_next_glitch_gap):
+        now = _now()
+        if now >= due["pulse"]:
+            if root.overlay_open or root._iconic:
+                # header can't be seen: skip the recolor and check back slowly
+                due["pulse"] = now + 1.0
+            else:
+                pulse_label()
+                due["pulse"] = now + 0.35
+        if now >= due["glitch"]:
+            due["glitch"] = now + _gap() / 1000
+            # a failed glitch must not break the chain the pulse also runs on
+            try:
+                _glitch(root)
+            except Exception:
+                pass
+        wait_ms = int((min(due.values()) - _now()) * 1000)
+        _after(max(10, wait_ms), tick)
 
-    # initial schedule for the first glitch
-    root.after(random.randint(3000, 8000), glitch_loop)
+    tick()
 
 
     root.mainloop()